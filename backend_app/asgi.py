@@ -0,0 +1,12 @@
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend_app.settings")
+
+application = get_asgi_application()
+
+# Load the schedule while the worker boots instead of on the first request; only serving processes get here
+from scheduler.services import warm_up_schedule  # noqa: E402
+
+warm_up_schedule()
@@ -70,6 +70,12 @@ DATABASES = {
     }
 }
 
+# Optional directory for pickled copies of the parsed data files, so restarts skip JSON parsing
+SCHEDULER_DATA_CACHE_DIR = os.environ.get("SCHEDULER_DATA_CACHE_DIR") or None
+
+# Seconds between background rebuilds of the cached schedule; 0 disables them and rebuilds on request
+SCHEDULER_REFRESH_INTERVAL = float(os.environ.get("SCHEDULER_REFRESH_INTERVAL", "0"))
+
 # Internationalization
 LANGUAGE_CODE = "en-us"
 TIME_ZONE = "UTC"
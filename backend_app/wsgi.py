@@ -5,3 +5,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend_app.settings")
 
 application = get_wsgi_application()
+
+# Load the schedule while the worker boots instead of on the first request; only serving processes get here
+from scheduler.services import warm_up_schedule  # noqa: E402
+
+warm_up_schedule()
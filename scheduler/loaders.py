@@ -4,16 +4,93 @@ JSON data loader with caching and error handling.
 Following Django 5.2 best practices for performance and error handling.
 """
 
+import hashlib
 import json
 import logging
+import os
+import pickle
+import tempfile
+import warnings
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from django.conf import settings
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - without ijson, streaming falls back to a full parse
+    ijson = None
+
 from .models import Position, Worker, Task, Assignment
 
 logger = logging.getLogger(__name__)
 
+# id -> item lookup: a list indexed by id when ids are dense, otherwise a dict
+IdIndex = Union[List[Optional[Any]], Dict[Any, Any]]
+
+
+def _index_by_id(records: List[Dict], to_value: Optional[Callable[[Dict], Any]] = None) -> IdIndex:
+    """Build an id lookup over records, mapping each id to to_value(record) (the record itself by default)."""
+    ids = [record["id"] for record in records]
+    return _index_values(ids, records if to_value is None else [to_value(record) for record in records])
+
+
+def _index_values(ids: List[Any], values: List[Any]) -> IdIndex:
+    """
+    Build an id lookup from parallel lists of ids and values.
+
+    Dense non-negative integer ids (the usual database case) get a list indexed by id:
+    one pointer per slot instead of a dict entry, with the same O(1) lookup.
+    Any other ids fall back to a dict.
+    """
+    max_id = -1
+    for record_id in ids:
+        if type(record_id) is not int or record_id < 0:
+            return dict(zip(ids, values))
+        if record_id > max_id:
+            max_id = record_id
+
+    if max_id >= 2 * len(ids) + 16:  # Too sparse for a list to pay off
+        return dict(zip(ids, values))
+
+    index: List[Optional[Any]] = [None] * (max_id + 1)
+    for record_id, value in zip(ids, values):
+        index[record_id] = value
+    return index
+
+
+def _lookup(index: IdIndex, record_id: Any) -> Optional[Any]:
+    """Get an item from an id lookup, or None if the id is unknown."""
+    if type(index) is list:
+        if type(record_id) is int and 0 <= record_id < len(index):
+            return index[record_id]
+        return None
+    return index.get(record_id)
+
+
+def _json_loads(buffer) -> Any:
+    """Parse JSON from a bytes-like buffer, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(buffer)
+    return json.loads(bytes(buffer))
+
+
+def _read_json(file_path: Path) -> Any:
+    """
+    Parse a JSON file read into memory in one call.
+
+    The file is read rather than memory-mapped: a mapped file that is rewritten in place
+    while it is parsed kills the process with SIGBUS, where a read only sees a short or
+    malformed document that the parser reports.
+    """
+    with open(file_path, "rb") as f:
+        return _json_loads(f.read())
+
 
 class DataLoaderError(Exception):
     """Custom exception for data loading errors."""
@@ -26,20 +103,44 @@ class DataLoader:
     Handles loading and caching of JSON data with proper error handling.
     """
 
-    def __init__(self, base_dir: Optional[Path] = None) -> None:
-        """Initialize DataLoader with base directory."""
+    DATA_FILES = ("positions.json", "workers.json", "tasks.json", "assignments.json")
+
+    # Cached attributes derived from each data file, cleared when that file changes
+    _CACHED_ATTRIBUTES = {
+        "positions.json": ("_positions", "_positions_by_id"),
+        "workers.json": ("_workers", "_workers_by_id"),
+        "tasks.json": ("_tasks", "_tasks_by_id", "_task_fields_by_id"),
+        "assignments.json": ("_assignments", "_assignments_by_task_id"),
+    }
+
+    def __init__(self, base_dir: Optional[Path] = None, cache_dir: Optional[Path] = None) -> None:
+        """
+        Initialize DataLoader with base directory.
+
+        Args:
+            base_dir: Directory containing the data/ folder, defaults to settings.BASE_DIR
+            cache_dir: Optional directory for pickled copies of parsed files, reused while the source is unchanged
+        """
         self._positions: Optional[List[Position]] = None
         self._workers: Optional[List[Worker]] = None
         self._tasks: Optional[List[Task]] = None
         self._assignments: Optional[List[Assignment]] = None
 
-        # Dictionary lookups for O(1) access
-        self._positions_by_id: Optional[Dict[int, Position]] = None
-        self._workers_by_id: Optional[Dict[int, Worker]] = None
-        self._tasks_by_id: Optional[Dict[int, Task]] = None
-        self._assignments_by_task_id: Optional[Dict[int, Assignment]] = None
+        # Id lookups for O(1) access
+        self._positions_by_id: Optional[IdIndex] = None
+        self._workers_by_id: Optional[IdIndex] = None
+        self._tasks_by_id: Optional[IdIndex] = None
+        self._assignments_by_task_id: Optional[Dict[int, List[Assignment]]] = None
+        self._task_fields_by_id: Optional[IdIndex] = None
+
+        # Source signature the cached data was last refreshed against, None until the first refresh
+        self._refreshed_signature: Optional[Tuple] = None
+
+        # Display labels of task dates; a label depends only on the date, so it outlives refreshes of the data
+        self._formatted_dates: Dict[str, str] = {}
 
         self._base_dir = base_dir or settings.BASE_DIR
+        self._cache_dir = Path(cache_dir) if cache_dir else None
 
     def _load_json_file(self, filename: str) -> List[Dict]:
         """
@@ -60,12 +161,21 @@ class DataLoader:
             if not file_path.exists():
                 raise DataLoaderError(f"Data file not found: {filename}")
 
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            file_stat = file_path.stat()
+            stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+            data = self._read_parsed_cache(file_path, stamp) if self._cache_dir else None
+            if data is not None:
+                logger.info(f"Loaded {len(data)} items from parse cache of {filename}")
+                return data
+
+            data = _read_json(file_path)
 
             if not isinstance(data, list):
                 raise DataLoaderError(f"Expected list in {filename}, got {type(data).__name__}")
 
+            if self._cache_dir:
+                self._write_parsed_cache(file_path, stamp, data)
+
             logger.info(f"Successfully loaded {len(data)} items from {filename}")
             return data
 
@@ -74,15 +184,60 @@ class DataLoader:
         except OSError as e:
             raise DataLoaderError(f"Cannot read file {filename}: {e}") from e
 
+    def _parsed_cache_path(self, file_path: Path) -> Path:
+        """Return the parse cache file for a data file, keyed on its absolute path."""
+        path_key = hashlib.blake2b(str(file_path.resolve()).encode(), digest_size=8).hexdigest()
+        return self._cache_dir / f"{file_path.name}.{path_key}.pickle"
+
+    def _read_parsed_cache(self, file_path: Path, stamp: Tuple[int, int]) -> Optional[List[Dict]]:
+        """
+        Read a data file's parse cache.
+
+        Args:
+            file_path: Source JSON file
+            stamp: (mtime_ns, size) of the source file as it is now
+
+        Returns:
+            The cached list, or None if there is no cache for this version of the file
+        """
+        cache_path = self._parsed_cache_path(file_path)
+        try:
+            with open(cache_path, "rb") as f:
+                # The cache directory is private to this loader, so its pickles are trusted
+                if pickle.load(f) != stamp:  # nosec B301
+                    return None
+                return pickle.load(f)  # nosec B301
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable parse cache {cache_path.name}: {e}")
+            return None
+
+    def _write_parsed_cache(self, file_path: Path, stamp: Tuple[int, int], data: List[Dict]) -> None:
+        """Write a data file's parse cache atomically; failures only cost the next restart a JSON parse."""
+        cache_path = self._parsed_cache_path(file_path)
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self._cache_dir, prefix=f".{cache_path.name}.")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(stamp, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, cache_path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except (OSError, pickle.PicklingError) as e:
+            logger.warning(f"Cannot write parse cache {cache_path.name}: {e}")
+
     def get_positions(self) -> List[Position]:
         """Load and cache positions data."""
         if self._positions is None:
             try:
                 data = self._load_json_file("positions.json")
                 self._positions = data
-                # Create lookup dictionary
-                self._positions_by_id = {pos["id"]: pos for pos in data}
-                logger.debug(f"Cached {len(self._positions)} positions with lookup dictionary")
+                self._positions_by_id = _index_by_id(data)
+                logger.debug(f"Cached {len(self._positions)} positions with id lookup")
             except (KeyError, TypeError) as e:
                 raise DataLoaderError(f"Invalid positions data structure: {e}") from e
 
@@ -92,7 +247,7 @@ class DataLoader:
         """Get position by ID with O(1) lookup."""
         if self._positions_by_id is None:
             self.get_positions()  # This will initialize both list and dict
-        return self._positions_by_id.get(position_id)
+        return _lookup(self._positions_by_id, position_id)
 
     def get_workers(self) -> List[Worker]:
         """Load and cache workers data with position names."""
@@ -100,9 +255,8 @@ class DataLoader:
             try:
                 data = self._load_json_file("workers.json")
                 self._workers = data
-                # Create lookup dictionary
-                self._workers_by_id = {worker["id"]: worker for worker in data}
-                logger.debug(f"Cached {len(self._workers)} workers with lookup dictionary")
+                self._workers_by_id = _index_by_id(data)
+                logger.debug(f"Cached {len(self._workers)} workers with id lookup")
             except (KeyError, TypeError) as e:
                 raise DataLoaderError(f"Invalid workers data structure: {e}") from e
 
@@ -112,7 +266,7 @@ class DataLoader:
         """Get worker by ID with O(1) lookup."""
         if self._workers_by_id is None:
             self.get_workers()  # This will initialize both list and dict
-        return self._workers_by_id.get(worker_id)
+        return _lookup(self._workers_by_id, worker_id)
 
     def get_tasks(self) -> List[Task]:
         """Load and cache tasks data."""
@@ -120,9 +274,8 @@ class DataLoader:
             try:
                 data = self._load_json_file("tasks.json")
                 self._tasks = data
-                # Create lookup dictionary
-                self._tasks_by_id = {task["id"]: task for task in data}
-                logger.debug(f"Cached {len(self._tasks)} tasks with lookup dictionary")
+                self._tasks_by_id = _index_by_id(data)
+                logger.debug(f"Cached {len(self._tasks)} tasks with id lookup")
             except (KeyError, TypeError) as e:
                 raise DataLoaderError(f"Invalid tasks data structure: {e}") from e
 
@@ -132,37 +285,186 @@ class DataLoader:
         """Get task by ID with O(1) lookup."""
         if self._tasks_by_id is None:
             self.get_tasks()  # This will initialize both list and dict
-        return self._tasks_by_id.get(task_id)
+        return _lookup(self._tasks_by_id, task_id)
+
+    def get_task_fields_by_id(self) -> IdIndex:
+        """
+        Get (date, duration, position_id) of every task, indexable by task ID.
+
+        A compact tuple per task: callers index the lookup directly and unpack,
+        instead of a method call and three dict lookups per task. Like the other
+        id lookups this is a list when task ids are dense, so unknown ids may read as None.
+        Tasks are streamed when not already loaded, so only the tuples are kept in memory.
+        """
+        if self._task_fields_by_id is None:
+            ids = []
+            fields = []
+            try:
+                for task in self.iter_tasks():
+                    ids.append(task["id"])
+                    fields.append((task["date"], task["duration"], task["position_id"]))
+            except (KeyError, TypeError) as e:
+                raise DataLoaderError(f"Invalid tasks data structure: {e}") from e
+            self._task_fields_by_id = _index_values(ids, fields)
+            logger.debug(f"Built field lookup for {len(fields)} tasks")
+
+        return self._task_fields_by_id
+
+    def get_formatted_dates_cache(self) -> Dict[str, str]:
+        """Get the memo of formatted task dates (date string -> display label) for callers to read and fill."""
+        return self._formatted_dates
 
     def get_assignments(self) -> List[Assignment]:
         """Load and cache assignments data."""
         if self._assignments is None:
+            self._assignments = self._load_json_file("assignments.json")
+            logger.debug(f"Cached {len(self._assignments)} assignments")
+
+        return self._assignments
+
+    def get_assignments_by_task_id(self, task_id: int) -> List[Assignment]:
+        """
+        Get all assignments of a task with O(1) lookup.
+
+        A task can have several assignments. The lookup is built on first use because
+        schedule processing iterates the assignments list and never needs it.
+        """
+        if self._assignments_by_task_id is None:
+            assignments_by_task_id = defaultdict(list)
             try:
-                data = self._load_json_file("assignments.json")
-                self._assignments = data
-                # Create lookup dictionary
-                self._assignments_by_task_id = {assignment["task_id"]: assignment for assignment in data}
-                logger.debug(f"Cached {len(self._assignments)} assignments with lookup dictionary")
+                for assignment in self.get_assignments():
+                    assignments_by_task_id[assignment["task_id"]].append(assignment)
             except (KeyError, TypeError) as e:
                 raise DataLoaderError(f"Invalid assignments data structure: {e}") from e
+            self._assignments_by_task_id = dict(assignments_by_task_id)
+            logger.debug(f"Built assignment lookup for {len(self._assignments_by_task_id)} tasks")
 
-        return self._assignments
+        return self._assignments_by_task_id.get(task_id, [])
 
     def get_assignment_by_task_id(self, task_id: int) -> Optional[Assignment]:
-        """Get assignment by task ID with O(1) lookup."""
-        if self._assignments_by_task_id is None:
-            self.get_assignments()  # This will initialize both list and dict
-        return self._assignments_by_task_id.get(task_id)
-
-    def refresh_cache(self) -> None:
-        """Clear cached data to force reload on next access."""
-        self._positions = None
-        self._workers = None
-        self._tasks = None
-        self._assignments = None
-        # Clear lookup dictionaries too
-        self._positions_by_id = None
-        self._workers_by_id = None
-        self._tasks_by_id = None
-        self._assignments_by_task_id = None
+        """
+        Get one assignment of a task, or None if it has none.
+
+        Deprecated: a task can have several assignments, use get_assignments_by_task_id().
+        Returns the last assignment of the task, like the single-value lookup this used to read.
+        """
+        warnings.warn(
+            "get_assignment_by_task_id() is deprecated, use get_assignments_by_task_id()",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        assignments = self.get_assignments_by_task_id(task_id)
+        return assignments[-1] if assignments else None
+
+    def iter_tasks(self) -> Iterator[Task]:
+        """
+        Iterate tasks without holding the whole file in memory.
+
+        Uses the cached list when tasks are already loaded. Otherwise records are read
+        without being cached on the loader, see _iter_json_file().
+        """
+        if self._tasks is not None:
+            return iter(self._tasks)
+        return self._iter_json_file("tasks.json")
+
+    def iter_assignments(self) -> Iterator[Assignment]:
+        """
+        Iterate assignments without holding the whole file in memory.
+
+        Uses the cached list when assignments are already loaded. Otherwise records are read
+        without being cached on the loader, see _iter_json_file().
+        """
+        if self._assignments is not None:
+            return iter(self._assignments)
+        return self._iter_json_file("assignments.json")
+
+    def _iter_json_file(self, filename: str) -> Iterator[Dict]:
+        """
+        Iterate the records of a data file that is not cached on the loader.
+
+        With a parse cache directory the file is loaded whole through its parse cache, so a
+        restart reads the pickle instead of parsing the JSON. Otherwise records are streamed
+        from disk (with ijson, when installed), so the whole file is never held in memory.
+        """
+        if self._cache_dir or ijson is None:
+            return iter(self._load_json_file(filename))
+        return self._stream_json_file(filename)
+
+    def _stream_json_file(self, filename: str) -> Iterator[Dict]:
+        """
+        Yield the items of a JSON array file one at a time.
+
+        Raises:
+            DataLoaderError: If the file is missing, unreadable, not a JSON array or malformed
+        """
+        file_path = self._base_dir / "data" / filename
+
+        try:
+            # Read through the file object rather than a memory map (ijson already reads it in chunks):
+            # a mapped file rewritten in place during the stream would kill the process with SIGBUS
+            with open(file_path, "rb") as f:
+                head = b""
+                while not head:
+                    chunk = f.read(4096)
+                    if not chunk:
+                        break
+                    head = chunk.lstrip()
+                if not head.startswith(b"["):
+                    raise DataLoaderError(f"Expected list in {filename}")
+
+                f.seek(0)
+                yield from ijson.items(f, "item", use_float=True)
+
+        except FileNotFoundError as e:
+            raise DataLoaderError(f"Data file not found: {filename}") from e
+        except ijson.JSONError as e:
+            raise DataLoaderError(f"Invalid JSON in {filename}: {e}") from e
+        except OSError as e:
+            raise DataLoaderError(f"Cannot read file {filename}: {e}") from e
+
+    def get_source_signature(self) -> Tuple:
+        """
+        Get a cheap fingerprint of the data files: (name, mtime_ns, size) per file, None if missing.
+
+        It changes whenever a file is rewritten, so it can key caches of anything derived from the data.
+        """
+        signature = []
+        for filename in self.DATA_FILES:
+            try:
+                file_stat = (self._base_dir / "data" / filename).stat()
+                signature.append((filename, file_stat.st_mtime_ns, file_stat.st_size))
+            except OSError:
+                signature.append((filename, None, None))
+        return tuple(signature)
+
+    def refresh_changed_files(self, signature: Tuple) -> None:
+        """
+        Clear the cached data of the files that changed since the previous call.
+
+        Data derived from unchanged files stays cached, so a rebuild after one file changes
+        reloads only that file. The first call clears everything, since the version of any
+        data loaded before it is unknown.
+
+        Args:
+            signature: Current source signature, from get_source_signature()
+        """
+        previous = self._refreshed_signature
+        if previous is None:
+            self.refresh_cache()
+        else:
+            changed = [entry[0] for entry, previous_entry in zip(signature, previous) if entry != previous_entry]
+            if changed:
+                self.refresh_cache(changed)
+        self._refreshed_signature = signature
+
+    def refresh_cache(self, filenames: Optional[Iterable[str]] = None) -> None:
+        """
+        Clear cached data to force reload on next access.
+
+        Args:
+            filenames: Only clear the data derived from these files, defaults to every data file
+        """
+        for filename in self.DATA_FILES if filenames is None else filenames:
+            for attribute in self._CACHED_ATTRIBUTES[filename]:
+                setattr(self, attribute, None)
         logger.info("Data cache cleared")
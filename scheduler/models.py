@@ -3,7 +3,7 @@ from datetime import date
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Position:
     """Represents a job position like Supervisor, Welder, Fitter."""
 
@@ -14,7 +14,7 @@ class Position:
         return self.name
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Worker:
     """Represents a worker assigned to a position."""
 
@@ -29,7 +29,7 @@ class Worker:
         return self.name
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Task:
     """Represents a task with duration and date, assigned to a position."""
 
@@ -48,7 +48,7 @@ class Task:
         return f"Task {self.id} for position {self.position_id} on {self.date}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Assignment:
     """Represents assignment of a task to a specific worker."""
 
@@ -1,15 +1,61 @@
 import logging
 from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Iterable, List, Tuple
 from django.utils.dateformat import format as date_format
 
-from .loaders import DataLoader
+from .loaders import DataLoader, IdIndex
 from .constants import EMPTY_POSITION_ID, EMPTY_POSITION_NAME
 
 logger = logging.getLogger(__name__)
 
 
+def aggregate_assignments(assignments: Iterable[Dict], task_fields_by_id: IdIndex) -> Tuple[Dict, Dict, Dict]:
+    """
+    Sum task durations per worker and per position for every date, in one pass over the assignments.
+
+    This is the hot loop of schedule processing, kept free of loader and processor state.
+
+    Args:
+        assignments: Assignment records with 'task_id' and 'worker_id'
+        task_fields_by_id: (date, duration, position_id) of each task, indexable by task ID
+
+    Returns:
+        Tuple of (worker -> date -> duration, position -> set of worker IDs, position -> date -> duration).
+        Tasks without a position are grouped under EMPTY_POSITION_ID.
+
+    Raises:
+        ScheduleProcessorError: If an assignment refers to an unknown task
+    """
+    # Inner maps default to 0 so totals accumulate with +=
+    worker_date = defaultdict(lambda: defaultdict(int))
+    position_worker = defaultdict(set)
+    position_date = defaultdict(lambda: defaultdict(int))
+    # A dense list would wrap a negative id around to another task, so those ids are rejected up front
+    dense = type(task_fields_by_id) is list
+
+    for assignment in assignments:
+        worker_id = assignment["worker_id"]
+        task_id = assignment["task_id"]
+        try:
+            if dense and task_id < 0:
+                raise IndexError(task_id)
+            date, duration, position_id = task_fields_by_id[task_id]
+        except (IndexError, KeyError, TypeError) as e:
+            # Missing ids raise IndexError or KeyError; gaps in a dense list hold None
+            raise ScheduleProcessorError(f"Assignment refers to unknown task {task_id!r}") from e
+
+        # Handle null position_id - use special constant
+        if position_id is None:
+            position_id = EMPTY_POSITION_ID
+
+        worker_date[worker_id][date] += duration
+        position_worker[position_id].add(worker_id)
+        position_date[position_id][date] += duration
+
+    return worker_date, position_worker, position_date
+
+
 class ScheduleProcessorError(Exception):
     """Custom exception for schedule processing errors."""
 
@@ -27,17 +73,43 @@ class ScheduleDataProcessor:
         """
         Format date string to 'DD MMM YY' format.
 
+        Memoized on the data loader and kept across data refreshes, so each date is formatted only once.
+
         Args:
             date_str: Date in YYYY-MM-DD format
 
         Returns:
             Formatted date string like '11 Jan 25'
         """
-        try:
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-            return date_format(date_obj, "d M y")
-        except ValueError as e:
-            raise ScheduleProcessorError(f"Invalid date format '{date_str}': {e}") from e
+        formatted_dates = self.data_loader.get_formatted_dates_cache()
+        formatted = formatted_dates.get(date_str)
+        if formatted is None:
+            try:
+                date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
+            except ValueError as e:
+                raise ScheduleProcessorError(f"Invalid date format '{date_str}': {e}") from e
+            formatted = formatted_dates[date_str] = date_format(date_obj, "d M y")
+        return formatted
+
+    @staticmethod
+    def _build_row(name: str, durations: Dict[str, int], date_index: Dict[str, int], width: int) -> List:
+        """
+        Build a table row: the name followed by one duration cell per date.
+
+        Args:
+            name: Position or worker name for the first cell
+            durations: Total duration keyed by date, only for dates that have work
+            date_index: Column of each date in the row (the name is column 0)
+            width: Total number of columns including the name
+
+        Returns:
+            Pre-sized row with 0 where there is no work
+        """
+        row = [0] * width
+        row[0] = name
+        for date, duration in durations.items():
+            row[date_index[date]] = duration
+        return row
 
     def process_schedule_data(self) -> Dict:
         """
@@ -49,41 +121,23 @@ class ScheduleDataProcessor:
         try:
             logger.info("Starting schedule data processing")
 
-            assignments = self.data_loader.get_assignments()
-
-            dates = set()
-            worker_date = defaultdict(dict)  # 2D map to store work duration for each worker on each date
-            position_worker = defaultdict(set)  # Position to workers existing in the assignments
-            position_date = defaultdict(dict)  # 2D map to store work duration for each position on each date
-
-            for assignment in assignments:
-                date = self.data_loader.get_task_by_id(assignment["task_id"])["date"]
-                worker_id = assignment["worker_id"]
-
-                # Get task duration
-                task = self.data_loader.get_task_by_id(assignment["task_id"])
-                duration = task["duration"]
-
-                # Handle null position_id - use special constant
-                position_id = task["position_id"] if task["position_id"] is not None else EMPTY_POSITION_ID
-
-                # Add duration to worker_date
-                worker_date[worker_id][date] = worker_date[worker_id].get(date, 0) + duration
-
-                # Add date to dates set
-                dates.add(date)
-
-                # Add worker to position_worker
-                position_worker[position_id].add(worker_id)
-
-                # Add duration to position_date
-                position_date[position_id][date] = position_date[position_id].get(date, 0) + duration
+            # Streamed when not already cached, so a cold load never holds every assignment at once
+            worker_date, position_worker, position_date = aggregate_assignments(
+                self.data_loader.iter_assignments(), self.data_loader.get_task_fields_by_id()
+            )
 
             schedule = []
-            dates = sorted(dates)
+            # Every date with work appears in some position's totals; collect them once instead of per assignment
+            dates = sorted({date for durations in position_date.values() for date in durations})
+
+            # Column of each date (after the name column), so rows are filled from the sparse totals
+            date_index = {date: i for i, date in enumerate(dates, start=1)}
+            width = len(dates) + 1
 
-            # Sort positions to show empty position last
-            sorted_positions = sorted(position_worker.keys(), key=lambda x: (x == EMPTY_POSITION_ID, x))
+            # Sort positions to show empty position last; the ids sort natively without a key function
+            sorted_positions = sorted(pid for pid in position_worker if pid != EMPTY_POSITION_ID)
+            if EMPTY_POSITION_ID in position_worker:
+                sorted_positions.append(EMPTY_POSITION_ID)
 
             for position_id in sorted_positions:
                 # Handle position name for empty position
@@ -92,14 +146,12 @@ class ScheduleDataProcessor:
                 else:
                     position_name = self.data_loader.get_position_by_id(position_id)["name"]
 
-                position_row = [position_name] + [position_date[position_id].get(date, 0) for date in dates]
-                schedule.append(position_row)
+                schedule.append(self._build_row(position_name, position_date[position_id], date_index, width))
 
                 # Insert worker rows of this position under the position row
                 for worker_id in position_worker[position_id]:
                     worker_name = self.data_loader.get_worker_by_id(worker_id)["name"]
-                    worker_row = [worker_name] + [worker_date[worker_id].get(date, 0) for date in dates]
-                    schedule.append(worker_row)
+                    schedule.append(self._build_row(worker_name, worker_date[worker_id], date_index, width))
 
             formatted_dates = [self._format_date(date) for date in dates]
             columns = ["Name"] + formatted_dates if len(schedule) > 0 else []
@@ -0,0 +1,40 @@
+"""
+orjson-backed JSON renderer for DRF responses.
+"""
+
+from typing import Any, Optional
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Render responses with orjson, which encodes straight to UTF-8 bytes.
+
+    Output matches DRF's compact JSONRenderer. Falls back to it when orjson is not installed.
+    """
+
+    media_type = "application/json"
+    format = "json"
+    charset = None  # JSON is always UTF-8, so no charset parameter (same as JSONRenderer)
+
+    # Coerce non-string dict keys to strings like the stdlib encoder behind JSONRenderer, instead of failing.
+    # Dates and times are passed to DRF's encoder: orjson's own format differs for datetimes
+    # (+00:00 rather than Z, microseconds rather than milliseconds)
+    orjson_options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME if orjson is not None else 0
+
+    # Only called for types orjson does not serialize natively (Decimal, lazy translations, ...) or passes through
+    _default = staticmethod(JSONEncoder().default)
+
+    def render(self, data: Any, accepted_media_type: Optional[str] = None, renderer_context=None) -> bytes:
+        if data is None:
+            return b""
+        if orjson is None:
+            return JSONRenderer().render(data, accepted_media_type, renderer_context)
+        return orjson.dumps(data, default=self._default, option=self.orjson_options)
@@ -1,8 +1,15 @@
-from typing import Dict, Optional
+import gzip
+import hashlib
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 import logging
+from django.conf import settings
 
 from .loaders import DataLoader, DataLoaderError
 from .processors import ScheduleDataProcessor, ScheduleProcessorError
+from .renderers import ORJSONRenderer
 
 logger = logging.getLogger(__name__)
 
@@ -10,12 +17,45 @@ logger = logging.getLogger(__name__)
 _data_loader: Optional[DataLoader] = None
 _processor: Optional[ScheduleDataProcessor] = None
 
+# Last processed schedule with the data file signature it was built from
+_cached_result: Optional[Tuple[Tuple, Dict]] = None
+
+# In-flight rebuild of the schedule: the signature it is for and the future its callers wait on,
+# so concurrent requests after a data change share one rebuild and its outcome
+_rebuild: Optional[Tuple[Tuple, Future]] = None
+_process_lock = threading.Lock()  # Guards _rebuild
+_rebuild_lock = threading.Lock()  # Held while rebuilding; the data loader is not thread-safe
+
+# Held while encoding the cached schedule, so concurrent requests share one encoding
+_serialize_lock = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class SerializedSchedule:
+    """A processed schedule together with its JSON response body, the body's ETag and a gzipped copy."""
+
+    data: Dict
+    body: bytes
+    etag: str
+    gzipped_body: Optional[bytes] = None  # None when compressing would not make the body smaller
+
+
+# JSON encoding of the last processed schedule
+_cached_serialized: Optional[SerializedSchedule] = None
+
+# Background refresh thread, and the event that stops it
+_refresh_thread: Optional[threading.Thread] = None
+_refresh_stop = threading.Event()
+
+# Bodies shorter than this are not worth compressing (same cut-off as Django's GZipMiddleware)
+GZIP_MIN_LENGTH = 200
+
 
 def _get_data_loader() -> DataLoader:
     """Get or create the global DataLoader instance."""
     global _data_loader
     if _data_loader is None:
-        _data_loader = DataLoader()
+        _data_loader = DataLoader(cache_dir=settings.SCHEDULER_DATA_CACHE_DIR)
         logger.debug("Created new DataLoader instance")
     return _data_loader
 
@@ -29,10 +69,85 @@ def _get_processor() -> ScheduleDataProcessor:
     return _processor
 
 
+def preload_schedule_data() -> None:
+    """
+    Build the schedule while the app starts so the first request is served from cache.
+
+    Failures are logged rather than raised so the app can still start without data files.
+    """
+    try:
+        get_serialized_schedule_data()
+    except (DataLoaderError, ScheduleProcessorError) as e:
+        logger.warning(f"Failed to preload schedule data: {e}")
+
+
+def warm_up_schedule() -> None:
+    """
+    Build the schedule and start the background refresh if SCHEDULER_REFRESH_INTERVAL is set.
+
+    Called from the WSGI and ASGI entry points, so only serving processes pay for the
+    load; management commands (migrate, check, shell, test, ...) skip it.
+    """
+    preload_schedule_data()
+    if settings.SCHEDULER_REFRESH_INTERVAL > 0:
+        start_background_refresh(settings.SCHEDULER_REFRESH_INTERVAL)
+
+
+def start_background_refresh(interval: float) -> None:
+    """
+    Rebuild the cached schedule every interval seconds on a daemon thread.
+
+    While the thread runs, requests are always served the last good schedule and never rebuild
+    it themselves: a data file change is picked up at the next tick, and a failed rebuild keeps
+    the previous schedule. Does nothing if the refresh thread is already running.
+    """
+    global _refresh_thread
+    if _refresh_thread is not None and _refresh_thread.is_alive():
+        return
+
+    _refresh_stop.clear()
+    _refresh_thread = threading.Thread(target=_refresh_loop, args=(interval,), name="schedule-refresh", daemon=True)
+    _refresh_thread.start()
+    logger.info(f"Refreshing schedule data every {interval} seconds")
+
+
+def stop_background_refresh() -> None:
+    """Stop the background refresh thread, if running."""
+    global _refresh_thread
+    _refresh_stop.set()
+    if _refresh_thread is not None:
+        _refresh_thread.join()
+        _refresh_thread = None
+
+
+def _refresh_schedule_data() -> None:
+    """Rebuild and encode the cached schedule if a data file changed, keeping the last good one on failure."""
+    try:
+        _serialize_schedule(_get_current_schedule_data())
+    except (DataLoaderError, ScheduleProcessorError) as e:
+        logger.warning(f"Failed to refresh schedule data, still serving the last good schedule: {e}")
+
+
+def _refresh_loop(interval: float) -> None:
+    """Rebuild the cached schedule (when a data file changed) until stopped."""
+    while not _refresh_stop.wait(interval):
+        try:
+            _refresh_schedule_data()
+        except Exception:
+            # Keep refreshing: an unexpected failure (e.g. OSError, MemoryError) must not end the thread for good
+            logger.exception("Background schedule refresh failed")
+
+
 def get_schedule_data() -> Dict:
     """
     Public interface to get processed schedule data.
 
+    The result is cached until one of the data files changes (checked with os.stat),
+    so repeated calls skip loading and processing. Concurrent calls share a single rebuild.
+    While the background refresh runs, the cached result is returned without checking the
+    files, and only a cold cache is built on the calling thread.
+    Treat the returned dict as read-only.
+
     Returns:
         Dictionary with 'columns' and 'rows' keys for frontend consumption
 
@@ -40,9 +155,89 @@ def get_schedule_data() -> Dict:
         DataLoaderError: If data cannot be loaded from JSON files
         ScheduleProcessorError: If data processing fails
     """
+    cached = _cached_result
+    refresh_thread = _refresh_thread
+    if cached is not None and refresh_thread is not None and refresh_thread.is_alive():
+        return cached[1]
+    return _get_current_schedule_data()
+
+
+def _get_current_schedule_data() -> Dict:
+    """Get the processed schedule of the data files as they are now, rebuilding it if one of them changed."""
+    global _cached_result, _rebuild
     try:
         processor = _get_processor()
-        return processor.process_schedule_data()
+        signature = processor.data_loader.get_source_signature()
+        cached = _cached_result
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        with _process_lock:
+            # Another thread may have rebuilt the schedule, or be rebuilding it, for these files
+            cached = _cached_result
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            rebuild = _rebuild
+            owner = rebuild is None or rebuild[0] != signature
+            if owner:
+                rebuild = _rebuild = (signature, Future())
+        future = rebuild[1]
+
+        if owner:
+            try:
+                with _rebuild_lock:
+                    # Reload the files that changed, so the result matches them as they were when the
+                    # signature was taken; the lookups built from unchanged files are reused
+                    processor.data_loader.refresh_changed_files(signature)
+                    data = processor.process_schedule_data()
+                    _cached_result = (signature, data)
+                future.set_result(data)
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with _process_lock:
+                    if _rebuild is rebuild:
+                        _rebuild = None
+
+        # Waiters share the owner's outcome, failures included, instead of each rebuilding in turn
+        return future.result()
     except (DataLoaderError, ScheduleProcessorError) as e:
         logger.error(f"Failed to get schedule data: {e}")
         raise
+
+
+def get_serialized_schedule_data() -> SerializedSchedule:
+    """
+    Get processed schedule data together with its JSON encoding.
+
+    The body, its ETag and its gzipped copy are computed once per processed result, so while
+    the data files are unchanged a response needs no processing, serialization, hashing or compression.
+
+    Raises:
+        DataLoaderError: If data cannot be loaded from JSON files
+        ScheduleProcessorError: If data processing fails
+    """
+    return _serialize_schedule(get_schedule_data())
+
+
+def _serialize_schedule(data: Dict) -> SerializedSchedule:
+    """Get the encodings of a processed schedule, computing them unless they are already cached."""
+    global _cached_serialized
+    cached = _cached_serialized
+    if cached is not None and cached.data is data:
+        return cached
+
+    with _serialize_lock:
+        cached = _cached_serialized
+        if cached is not None and cached.data is data:
+            return cached
+
+        body = ORJSONRenderer().render(data)
+        etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        gzipped_body = None
+        if len(body) >= GZIP_MIN_LENGTH:
+            gzipped_body = gzip.compress(body, compresslevel=6, mtime=0)
+            if len(gzipped_body) >= len(body):
+                gzipped_body = None
+        _cached_serialized = SerializedSchedule(data=data, body=body, etag=etag, gzipped_body=gzipped_body)
+        return _cached_serialized
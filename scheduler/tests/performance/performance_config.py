@@ -2,9 +2,12 @@
 Performance testing configuration and utilities.
 """
 
+import functools
 from dataclasses import dataclass
 from typing import Dict, Any
 
+import psutil
+
 
 @dataclass
 class PerformanceThresholds:
@@ -44,6 +47,28 @@ PERFORMANCE_THRESHOLDS = {
     ),
 }
 
+
+def skip_if_insufficient_ram(required_gb: float):
+    """
+    Skip a test when less than required_gb of RAM is available, instead of letting it exhaust memory.
+
+    Available RAM is sampled when the test runs, so memory already taken by earlier tests
+    and by the data built in setUpClass is accounted for.
+    """
+
+    def decorator(test_method):
+        @functools.wraps(test_method)
+        def wrapper(self, *args, **kwargs):
+            available_gb = psutil.virtual_memory().available / 1024**3
+            if available_gb < required_gb:
+                self.skipTest(f"Needs {required_gb} GB of available RAM, only {available_gb:.1f} GB available")
+            return test_method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 # Testing scenarios for different use cases
 TESTING_SCENARIOS = {
     "baseline": {"scale_factor": 1, "description": "Initial development load"},
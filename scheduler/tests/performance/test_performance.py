@@ -1,19 +1,38 @@
-import json
+import bisect
+import shutil
 import time
 import tempfile
+import tracemalloc
 import random
+from array import array
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from itertools import accumulate, chain
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from django.test import TestCase
 from unittest.mock import patch
+import orjson
 import psutil
 import os
 
 from scheduler.loaders import DataLoader
 from scheduler.processors import ScheduleDataProcessor
-from scheduler.tests.performance.performance_config import PERFORMANCE_THRESHOLDS
+from scheduler.tests.performance.performance_config import PERFORMANCE_THRESHOLDS, skip_if_insufficient_ram
+
+# RAM-backed filesystem for the fixture files, which are written once and read back right away
+TMPFS_DIR = "/dev/shm"
+TMPFS_MIN_FREE_BYTES = 4 * 1024**3
+
+
+def _fixture_temp_root() -> Optional[str]:
+    """Get the tmpfs directory when it exists with room to spare, else None for the default temp dir."""
+    if not os.path.isdir(TMPFS_DIR) or not os.access(TMPFS_DIR, os.W_OK):
+        return None
+    if shutil.disk_usage(TMPFS_DIR).free < TMPFS_MIN_FREE_BYTES:
+        return None
+    return TMPFS_DIR
 
 
 @dataclass
@@ -27,25 +46,40 @@ class PerformanceMetrics:
 
 
 class LargeDataGenerator:
-    """Generates large-scale test data for performance testing."""
+    """
+    Generates large-scale test data for performance testing.
+
+    Every scale unit is a block of positions, workers and tasks. Workers and tasks only reference
+    positions of their own block, so the first N blocks of a dataset form a valid dataset of scale N.
+    """
 
-    def __init__(self, base_scale_factor: int = 1000):
+    POSITIONS_PER_UNIT = 3
+    WORKERS_PER_UNIT = 10
+    TASKS_PER_UNIT = 50
+
+    def __init__(self, base_scale_factor: int = 1000, seed: Optional[int] = None):
         self.scale_factor = base_scale_factor
-        self.positions_count = 3 * base_scale_factor
-        self.workers_count = 10 * base_scale_factor
-        self.tasks_count = 50 * base_scale_factor
-        self.assignments_count = 50 * base_scale_factor
+        self.positions_count = self.POSITIONS_PER_UNIT * base_scale_factor
+        self.workers_count = self.WORKERS_PER_UNIT * base_scale_factor
+        self.tasks_count = self.TASKS_PER_UNIT * base_scale_factor
+        self.assignments_count = self.TASKS_PER_UNIT * base_scale_factor
+        self._random = random.Random(seed)
+
+    def _block_position_ids(self, count: int, per_unit: int) -> List[int]:
+        """Sample a position id for each of count rows, from the positions of the row's own block."""
+        positions_per_unit = self.POSITIONS_PER_UNIT
+        offsets = self._random.choices(range(1, positions_per_unit + 1), k=count)
+        return [i // per_unit * positions_per_unit + offset for i, offset in enumerate(offsets)]
 
     def generate_positions(self) -> List[Dict]:
         """Generate positions data."""
         base_positions = ["Supervisor", "Welder", "Fitter", "Engineer", "Technician", "Operator"]
-        positions = []
+        names = self._random.choices(base_positions, k=self.positions_count)
+        group_size = len(base_positions)
 
-        for i in range(self.positions_count):
-            positions.append({"id": i + 1, "name": f"{random.choice(base_positions)} {i // len(base_positions) + 1}"})
-        return positions
+        return [{"id": i + 1, "name": f"{name} {i // group_size + 1}"} for i, name in enumerate(names)]
 
-    def generate_workers(self, positions: List[Dict]) -> List[Dict]:
+    def generate_workers(self) -> List[Dict]:
         """Generate workers data with realistic distribution."""
         first_names = ["John", "Jane", "Mike", "Sarah", "David", "Lisa", "Chris", "Anna", "Tom", "Emma"]
         last_names = [
@@ -61,55 +95,56 @@ class LargeDataGenerator:
             "Martinez",
         ]
 
-        workers = []
-        for i in range(self.workers_count):
-            workers.append(
-                {
-                    "id": i + 1,
-                    "name": f"{random.choice(first_names)} {random.choice(last_names)}",
-                    "position_id": random.choice(positions)["id"],
-                }
-            )
-        return workers
+        # Every first/last name pair is formatted once, so each worker is one sampled index
+        full_names = [f"{first_name} {last_name}" for first_name in first_names for last_name in last_names]
+
+        # Sample every column in one call each instead of per-row random.choice calls
+        count = self.workers_count
+        position_ids = self._block_position_ids(count, self.WORKERS_PER_UNIT)
+        names = self._random.choices(full_names, k=count)
 
-    def generate_tasks(self, positions: List[Dict], date_range_days: int = 30) -> List[Dict]:
+        return [
+            {"id": i + 1, "name": name, "position_id": position_id}
+            for i, (name, position_id) in enumerate(zip(names, position_ids))
+        ]
+
+    def generate_tasks(self, date_range_days: int = 30) -> List[Dict]:
         """Generate tasks data across a date range."""
         start_date = datetime(2025, 1, 1).date()
-        tasks = []
-
-        for i in range(self.tasks_count):
-            random_days = random.randint(0, date_range_days - 1)
-            task_date = start_date + timedelta(days=random_days)
-
-            tasks.append(
-                {
-                    "id": i + 1,
-                    "position_id": random.choice(positions)["id"],
-                    "duration": random.randint(1, 8),  # 1-8 hours
-                    "date": task_date.strftime("%Y-%m-%d"),
-                }
-            )
-        return tasks
+        date_strings = [(start_date + timedelta(days=days)).strftime("%Y-%m-%d") for days in range(date_range_days)]
+
+        count = self.tasks_count
+        position_ids = self._block_position_ids(count, self.TASKS_PER_UNIT)
+        durations = self._random.choices(range(1, 9), k=count)  # 1-8 hours
+        dates = self._random.choices(date_strings, k=count)
+
+        return [
+            {"id": i + 1, "position_id": position_id, "duration": duration, "date": date}
+            for i, (position_id, duration, date) in enumerate(zip(position_ids, durations, dates))
+        ]
 
     def generate_assignments(self, tasks: List[Dict], workers: List[Dict]) -> List[Dict]:
         """Generate assignments ensuring referential integrity."""
-        assignments = []
-
-        # Create position_id to worker mapping for efficiency
-        position_workers = {}
+        # Worker ids grouped by position in one flat list: the workers of position p
+        # are worker_ids[offsets[p]:offsets[p + 1]], found without a dict lookup or branch
+        max_position_id = max((record["position_id"] for record in chain(workers, tasks)), default=0)
+        counts = [0] * (max_position_id + 2)
         for worker in workers:
-            pos_id = worker["position_id"]
-            if pos_id not in position_workers:
-                position_workers[pos_id] = []
-            position_workers[pos_id].append(worker["id"])
-
-        for i in range(self.assignments_count):
-            if i < len(tasks):
-                task = tasks[i]
-                # Assign to a worker with matching position
-                matching_workers = position_workers.get(task["position_id"], [])
-                if matching_workers:
-                    assignments.append({"task_id": task["id"], "worker_id": random.choice(matching_workers)})
+            counts[worker["position_id"] + 1] += 1
+        # Flat machine-int arrays instead of lists of int objects: a fraction of the memory at 100000x.
+        # Both are filled straight from iterators, without an intermediate list of ints
+        offsets = array("l", accumulate(counts))
+        worker_ids = array("l", (worker["id"] for worker in sorted(workers, key=itemgetter("position_id"))))
+
+        assignments = []
+        uniform = self._random.random
+        for task in tasks[: self.assignments_count]:
+            # Assign to a worker with matching position
+            start = offsets[task["position_id"]]
+            matching_count = offsets[task["position_id"] + 1] - start
+            if matching_count:
+                worker_id = worker_ids[start + int(uniform() * matching_count)]
+                assignments.append({"task_id": task["id"], "worker_id": worker_id})
 
         return assignments
 
@@ -122,8 +157,8 @@ class LargeDataGenerator:
         print(f"  - Assignments: {self.assignments_count}")
 
         positions = self.generate_positions()
-        workers = self.generate_workers(positions)
-        tasks = self.generate_tasks(positions)
+        workers = self.generate_workers()
+        tasks = self.generate_tasks()
         assignments = self.generate_assignments(tasks, workers)
 
         return positions, workers, tasks, assignments
@@ -132,16 +167,39 @@ class LargeDataGenerator:
 class PerformanceTestCase(TestCase):
     """Performance tests for ScheduleDataProcessor with large datasets."""
 
+    SCALING_FACTORS = [1, 10, 20, 50, 100]
+
+    @classmethod
+    def setUpClass(cls):
+        """Generate one seeded dataset that the small scales are sliced from."""
+        super().setUpClass()
+        cls.shared_scale = max(cls.SCALING_FACTORS)
+        cls.shared_data = LargeDataGenerator(cls.shared_scale, seed=0).generate_all_data()
+
+    @classmethod
+    def _generate_data(cls, scale_factor: int) -> Tuple[List, List, List, List]:
+        """Get a dataset for a scale, as a prefix of the shared dataset when it is large enough."""
+        if scale_factor > cls.shared_scale:
+            return LargeDataGenerator(scale_factor, seed=0).generate_all_data()
+
+        positions, workers, tasks, assignments = cls.shared_data
+        tasks_count = LargeDataGenerator.TASKS_PER_UNIT * scale_factor
+        assignments_count = bisect.bisect_right(assignments, tasks_count, key=lambda assignment: assignment["task_id"])
+        return (
+            positions[: LargeDataGenerator.POSITIONS_PER_UNIT * scale_factor],
+            workers[: LargeDataGenerator.WORKERS_PER_UNIT * scale_factor],
+            tasks[:tasks_count],
+            assignments[:assignments_count],
+        )
+
     def setUp(self):
         """Set up performance testing environment."""
-        self.test_dir = tempfile.mkdtemp()
+        self.test_dir = tempfile.mkdtemp(dir=_fixture_temp_root())
         self.test_data_dir = Path(self.test_dir) / "data"
         self.test_data_dir.mkdir()
 
     def tearDown(self):
         """Clean up test environment."""
-        import shutil
-
         shutil.rmtree(self.test_dir)
 
     def _write_data_files(self, positions: List, workers: List, tasks: List, assignments: List):
@@ -154,53 +212,63 @@ class PerformanceTestCase(TestCase):
         }
 
         for filename, data in files_data.items():
-            file_path = self.test_data_dir / filename
-            with open(file_path, "w") as f:
-                json.dump(data, f)
+            (self.test_data_dir / filename).write_bytes(orjson.dumps(data))
 
-    def _measure_performance(self, scale_factor: int) -> PerformanceMetrics:
-        """Measure processing performance for given scale."""
+    def _measure_performance(self, scale_factor: int) -> Tuple[PerformanceMetrics, Dict]:
+        """Measure processing performance for given scale, returning the metrics and the processed result."""
         # Generate data
-        generator = LargeDataGenerator(scale_factor)
-        positions, workers, tasks, assignments = generator.generate_all_data()
+        positions, workers, tasks, assignments = self._generate_data(scale_factor)
 
         # Write data files
         self._write_data_files(positions, workers, tasks, assignments)
 
+        # Only the counts are needed from here on. Releasing the generated records before measuring
+        # keeps millions of live dicts from inflating the garbage collector's work in the timed run.
+        data_scale = {
+            "positions": len(positions),
+            "workers": len(workers),
+            "tasks": len(tasks),
+            "assignments": len(assignments),
+        }
+        del positions, workers, tasks, assignments
+
         # Create processor
         loader = DataLoader(base_dir=Path(self.test_dir))
         processor = ScheduleDataProcessor(loader)
 
-        # Measure initial memory
-        process = psutil.Process(os.getpid())
-        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
-
         # Measure processing time
         start_time = time.time()
         result = processor.process_schedule_data()
         end_time = time.time()
 
-        # Measure peak memory
-        peak_memory = process.memory_info().rss / 1024 / 1024  # MB
+        # Measure memory in a second run on a fresh loader. Tracing allocations slows processing
+        # down too much to time the same run, and unlike an RSS delta the traced peak is not
+        # hidden by memory the allocator kept from earlier work in this process.
+        processor = ScheduleDataProcessor(DataLoader(base_dir=Path(self.test_dir)))
+        tracemalloc.start()
+        try:
+            processor.process_schedule_data()
+            _, traced_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # Process RSS afterwards, for information only
+        peak_memory = psutil.Process(os.getpid()).memory_info().rss / 1024 / 1024  # MB
 
         processing_time = end_time - start_time
-        memory_usage = peak_memory - initial_memory
+        memory_usage = traced_peak / 1024 / 1024  # MB
 
-        return PerformanceMetrics(
+        metrics = PerformanceMetrics(
             processing_time=processing_time,
             memory_usage_mb=memory_usage,
             peak_memory_mb=peak_memory,
-            data_scale={
-                "positions": len(positions),
-                "workers": len(workers),
-                "tasks": len(tasks),
-                "assignments": len(assignments),
-            },
+            data_scale=data_scale,
         )
+        return metrics, result
 
     def test_performance_baseline(self):
         """Test performance with baseline (current) dataset size."""
-        metrics = self._measure_performance(scale_factor=1)
+        metrics, _ = self._measure_performance(scale_factor=1)
 
         print(f"\nBaseline Performance:")
         print(f"  Processing time: {metrics.processing_time:.3f} seconds")
@@ -221,7 +289,7 @@ class PerformanceTestCase(TestCase):
 
     def test_performance_1000x_scale(self):
         """Test performance with 1000x dataset size"""
-        metrics = self._measure_performance(scale_factor=1000)
+        metrics, result = self._measure_performance(scale_factor=1000)
 
         print(f"\n1000x Scale Performance:")
         print(f"  Processing time: {metrics.processing_time:.3f} seconds")
@@ -242,17 +310,14 @@ class PerformanceTestCase(TestCase):
         )
 
         # Verify data integrity
-        loader = DataLoader(base_dir=Path(self.test_dir))
-        processor = ScheduleDataProcessor(loader)
-        result = processor.process_schedule_data()
-
         self.assertIn("columns", result)
         self.assertIn("rows", result)
         self.assertGreater(len(result["rows"]), 0, "Should produce output rows")
 
+    @skip_if_insufficient_ram(required_gb=2)
     def test_performance_10000x_scale(self):
         """Test performance with 10000x dataset size."""
-        metrics = self._measure_performance(scale_factor=10000)
+        metrics, _ = self._measure_performance(scale_factor=10000)
 
         print(f"\n10000x Scale Performance:")
         print(f"  Processing time: {metrics.processing_time:.3f} seconds")
@@ -271,9 +336,10 @@ class PerformanceTestCase(TestCase):
             "10000x scale should use less than the threshold",
         )
 
+    @skip_if_insufficient_ram(required_gb=16)
     def test_performance_100000x_scale(self):
         """Test performance with 100000x dataset size."""
-        metrics = self._measure_performance(scale_factor=100000)
+        metrics, _ = self._measure_performance(scale_factor=100000)
 
         print(f"\n100000x Scale Performance:")
         print(f"  Processing time: {metrics.processing_time:.3f} seconds")
@@ -294,11 +360,10 @@ class PerformanceTestCase(TestCase):
 
     def test_performance_scaling_cost_should_be_less_than_scaling_factor(self):
         """Test how performance scales across different data sizes."""
-        scale_factors = [1, 10, 20, 50, 100]
         metrics_list = []
 
-        for scale in scale_factors:
-            metrics = self._measure_performance(scale)
+        for scale in self.SCALING_FACTORS:
+            metrics, _ = self._measure_performance(scale)
             metrics_list.append((scale, metrics))
             print(f"\nScale {scale}x: {metrics.processing_time:.4f}s, {metrics.memory_usage_mb:.4f}MB")
 
@@ -1,3 +1,5 @@
+import gzip
+import json
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework.test import APIClient
@@ -21,10 +23,18 @@ class ScheduleAPITestCase(TestCase):
         response = self.client.get(self.schedule_url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn("columns", response.data)
-        self.assertIn("rows", response.data)
-        self.assertIsInstance(response.data["columns"], list)
-        self.assertIsInstance(response.data["rows"], list)
+        data = response.json()
+        self.assertIn("columns", data)
+        self.assertIn("rows", data)
+        self.assertIsInstance(data["columns"], list)
+        self.assertIsInstance(data["rows"], list)
+
+    async def test_schedule_table_async_client(self):
+        """Test the view when served through the ASGI handler."""
+        response = await self.async_client.get(self.schedule_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("rows", response.json())
 
     def test_schedule_table_headers(self):
         """Test API response headers and content type."""
@@ -33,7 +43,63 @@ class ScheduleAPITestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response["Content-Type"], "application/json")
 
-    @patch("scheduler.views.get_schedule_data")
+    def test_schedule_table_gzip(self):
+        """Test that clients accepting gzip get the cached compressed body."""
+        plain_response = self.client.get(self.schedule_url)
+        response = self.client.get(self.schedule_url, HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(json.loads(gzip.decompress(response.content)), plain_response.json())
+        self.assertFalse(plain_response.has_header("Content-Encoding"))
+
+    def test_schedule_table_etag_not_modified(self):
+        """Test that a request with the current ETag gets an empty 304."""
+        response = self.client.get(self.schedule_url)
+        etag = response["ETag"]
+
+        cached_response = self.client.get(self.schedule_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(cached_response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(cached_response.content, b"")
+        self.assertEqual(cached_response["ETag"], etag)
+
+    def test_schedule_table_stale_etag_returns_data(self):
+        """Test that a request with an outdated ETag gets the full response."""
+        response = self.client.get(self.schedule_url, HTTP_IF_NONE_MATCH='W/"outdated"')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("rows", response.json())
+        self.assertEqual(response["Cache-Control"], "private, max-age=0, must-revalidate")
+
+    def test_schedule_table_skips_info_logs_when_disabled(self):
+        """Test that no info records are created when INFO is disabled."""
+        with patch("scheduler.views.logger.isEnabledFor", return_value=False), patch(
+            "scheduler.views.logger.info"
+        ) as mock_info:
+            response = self.client.get(self.schedule_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_info.assert_not_called()
+
+    def test_schedule_table_head(self):
+        """Test that HEAD returns the GET headers without a body."""
+        get_response = self.client.get(self.schedule_url)
+        response = self.client.head(self.schedule_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], get_response["ETag"])
+        self.assertEqual(response["Content-Length"], str(len(get_response.content)))
+
+    def test_schedule_table_rejects_post(self):
+        """Test that only GET and HEAD are allowed."""
+        response = self.client.post(self.schedule_url)
+
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+    @patch("scheduler.views.get_serialized_schedule_data")
     def test_schedule_table_data_loader_error(self, mock_get_data):
         """Test API response when DataLoaderError occurs."""
         mock_get_data.side_effect = DataLoaderError("Test data loading error")
@@ -41,11 +107,13 @@ class ScheduleAPITestCase(TestCase):
         response = self.client.get(self.schedule_url)
 
         self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
-        self.assertIn("error", response.data)
-        self.assertEqual(response.data["code"], "DATA_LOAD_ERROR")
-        self.assertIn("Failed to load data from JSON files", response.data["error"])
+        data = response.json()
+        self.assertIn("error", data)
+        self.assertEqual(data["code"], "DATA_LOAD_ERROR")
+        self.assertIn("Failed to load data from JSON files", data["error"])
+        self.assertEqual(data["detail"], "Test data loading error")
 
-    @patch("scheduler.views.get_schedule_data")
+    @patch("scheduler.views.get_serialized_schedule_data")
     def test_schedule_table_processor_error(self, mock_get_data):
         """Test API response when ScheduleProcessorError occurs."""
         mock_get_data.side_effect = ScheduleProcessorError("Test processing error")
@@ -53,11 +121,28 @@ class ScheduleAPITestCase(TestCase):
         response = self.client.get(self.schedule_url)
 
         self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
-        self.assertIn("error", response.data)
-        self.assertEqual(response.data["code"], "PROCESSING_ERROR")
-        self.assertIn("Failed to process schedule data", response.data["error"])
+        data = response.json()
+        self.assertIn("error", data)
+        self.assertEqual(data["code"], "PROCESSING_ERROR")
+        self.assertIn("Failed to process schedule data", data["error"])
+
+    @patch("scheduler.views.get_serialized_schedule_data")
+    def test_schedule_table_error_subclass(self, mock_get_data):
+        """Test that subclasses of the expected errors keep their error code."""
+
+        class MissingFileError(DataLoaderError):
+            pass
+
+        mock_get_data.side_effect = MissingFileError("Test missing file")
+
+        response = self.client.get(self.schedule_url)
+
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        data = response.json()
+        self.assertEqual(data["code"], "DATA_LOAD_ERROR")
+        self.assertEqual(data["detail"], "Test missing file")
 
-    @patch("scheduler.views.get_schedule_data")
+    @patch("scheduler.views.get_serialized_schedule_data")
     def test_schedule_table_unexpected_error(self, mock_get_data):
         """Test API response when unexpected error occurs."""
         mock_get_data.side_effect = ValueError("Unexpected error")
@@ -65,9 +150,11 @@ class ScheduleAPITestCase(TestCase):
         response = self.client.get(self.schedule_url)
 
         self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
-        self.assertIn("error", response.data)
-        self.assertEqual(response.data["code"], "INTERNAL_ERROR")
-        self.assertIn("Internal server error", response.data["error"])
+        data = response.json()
+        self.assertIn("error", data)
+        self.assertEqual(data["code"], "INTERNAL_ERROR")
+        self.assertIn("Internal server error", data["error"])
+        self.assertEqual(data["detail"], "An unexpected error occurred")
 
     def test_schedule_table_response_structure(self):
         """Test that response has expected structure and data types."""
@@ -76,19 +163,20 @@ class ScheduleAPITestCase(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         # Verify response structure
-        self.assertIn("columns", response.data)
-        self.assertIn("rows", response.data)
+        data = response.json()
+        self.assertIn("columns", data)
+        self.assertIn("rows", data)
 
         # Verify data types
-        self.assertIsInstance(response.data["columns"], list)
-        self.assertIsInstance(response.data["rows"], list)
+        self.assertIsInstance(data["columns"], list)
+        self.assertIsInstance(data["rows"], list)
 
         # If there's data, verify column structure
-        if response.data["columns"]:
-            self.assertEqual(response.data["columns"][0], "Name")
+        if data["columns"]:
+            self.assertEqual(data["columns"][0], "Name")
 
         # If there are rows, verify row structure
-        if response.data["rows"]:
-            first_row = response.data["rows"][0]
+        if data["rows"]:
+            first_row = data["rows"][0]
             self.assertIsInstance(first_row, list)
             self.assertTrue(len(first_row) >= 1)  # At least name column
@@ -0,0 +1,237 @@
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from django.test import TestCase
+from unittest.mock import patch
+
+from scheduler.loaders import DataLoader, DataLoaderError
+
+
+class DataLoaderTestCase(TestCase):
+    """Test cases for DataLoader file parsing and lookups."""
+
+    def setUp(self):
+        """Create a temporary data directory with minimal fixtures."""
+        self.test_dir = tempfile.mkdtemp()
+        self.test_data_dir = Path(self.test_dir) / "data"
+        self.test_data_dir.mkdir()
+
+        self.positions_data = [{"id": 1, "name": "Manager"}, {"id": 2, "name": "Developer"}]
+        self.workers_data = [{"id": 1, "name": "Alice", "position_id": 1}]
+        self.tasks_data = [{"id": 1, "position_id": 1, "duration": 4, "date": "2025-01-15"}]
+        self.assignments_data = [{"task_id": 1, "worker_id": 1}]
+        self._write_test_files()
+
+        self.loader = DataLoader(base_dir=Path(self.test_dir))
+
+    def tearDown(self):
+        """Remove the temporary data directory."""
+        shutil.rmtree(self.test_dir)
+
+    def _write_test_files(self):
+        """Write fixture data to JSON files."""
+        files_data = {
+            "positions.json": self.positions_data,
+            "workers.json": self.workers_data,
+            "tasks.json": self.tasks_data,
+            "assignments.json": self.assignments_data,
+        }
+
+        for filename, data in files_data.items():
+            (self.test_data_dir / filename).write_text(json.dumps(data))
+
+    def test_get_positions_loads_file(self):
+        self.assertEqual(self.loader.get_positions(), self.positions_data)
+        self.assertEqual(self.loader.get_position_by_id(2)["name"], "Developer")
+        self.assertIsNone(self.loader.get_position_by_id(99))
+
+    def test_get_task_fields_by_id(self):
+        task_fields_by_id = self.loader.get_task_fields_by_id()
+
+        self.assertEqual(task_fields_by_id[1], ("2025-01-15", 4, 1))
+
+    def test_get_task_fields_by_id_streams_tasks_without_caching(self):
+        self.loader.get_task_fields_by_id()
+
+        self.assertIsNone(self.loader._tasks)
+        self.assertEqual(list(self.loader.iter_tasks()), self.tasks_data)
+
+    def test_get_task_fields_by_id_invalid_structure_raises_loader_error(self):
+        self.tasks_data.append({"id": 2, "position_id": 1})
+        self._write_test_files()
+
+        with self.assertRaises(DataLoaderError):
+            self.loader.get_task_fields_by_id()
+
+    def test_get_assignments_by_task_id_keeps_every_assignment(self):
+        self.workers_data.append({"id": 2, "name": "Bob", "position_id": 1})
+        self.assignments_data.append({"task_id": 1, "worker_id": 2})
+        self._write_test_files()
+
+        assignments = self.loader.get_assignments_by_task_id(1)
+
+        self.assertEqual([assignment["worker_id"] for assignment in assignments], [1, 2])
+        self.assertEqual(self.loader.get_assignments_by_task_id(99), [])
+
+    def test_get_assignment_by_task_id_is_deprecated(self):
+        self.assignments_data.append({"task_id": 1, "worker_id": 2})
+        self._write_test_files()
+
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(self.loader.get_assignment_by_task_id(1)["worker_id"], 2)
+        with self.assertWarns(DeprecationWarning):
+            self.assertIsNone(self.loader.get_assignment_by_task_id(99))
+
+    def test_get_assignments_does_not_build_task_lookup(self):
+        self.loader.get_assignments()
+
+        self.assertIsNone(self.loader._assignments_by_task_id)
+
+    def test_iter_assignments_streams_without_caching(self):
+        assignments = list(self.loader.iter_assignments())
+
+        self.assertEqual(assignments, self.assignments_data)
+        self.assertIsNone(self.loader._assignments)
+
+    def test_iter_assignments_uses_cached_list(self):
+        self.loader.get_assignments()
+
+        with patch.object(self.loader, "_stream_json_file") as mock_stream:
+            assignments = list(self.loader.iter_assignments())
+
+        mock_stream.assert_not_called()
+        self.assertEqual(assignments, self.assignments_data)
+
+    def test_iter_assignments_invalid_json_raises_loader_error(self):
+        (self.test_data_dir / "assignments.json").write_text('[{"task_id": 1,')
+
+        with self.assertRaises(DataLoaderError):
+            list(self.loader.iter_assignments())
+
+    def test_iter_assignments_non_list_raises_loader_error(self):
+        (self.test_data_dir / "assignments.json").write_text('  {"task_id": 1}')
+
+        with self.assertRaises(DataLoaderError):
+            list(self.loader.iter_assignments())
+
+    def test_iter_assignments_empty_file_raises_loader_error(self):
+        (self.test_data_dir / "assignments.json").write_bytes(b"")
+
+        with self.assertRaises(DataLoaderError):
+            list(self.loader.iter_assignments())
+
+    def test_parse_cache_is_reused_by_new_loader(self):
+        cache_dir = Path(self.test_dir) / "cache"
+        DataLoader(base_dir=Path(self.test_dir), cache_dir=cache_dir).get_positions()
+
+        with patch("scheduler.loaders._read_json") as mock_read_json:
+            positions = DataLoader(base_dir=Path(self.test_dir), cache_dir=cache_dir).get_positions()
+
+        mock_read_json.assert_not_called()
+        self.assertEqual(positions, self.positions_data)
+
+    def test_parse_cache_covers_streamed_files(self):
+        cache_dir = Path(self.test_dir) / "cache"
+        DataLoader(base_dir=Path(self.test_dir), cache_dir=cache_dir).get_task_fields_by_id()
+        list(DataLoader(base_dir=Path(self.test_dir), cache_dir=cache_dir).iter_assignments())
+
+        loader = DataLoader(base_dir=Path(self.test_dir), cache_dir=cache_dir)
+        with patch("scheduler.loaders._read_json") as mock_read_json:
+            task_fields_by_id = loader.get_task_fields_by_id()
+            assignments = list(loader.iter_assignments())
+
+        mock_read_json.assert_not_called()
+        self.assertEqual(task_fields_by_id[1], ("2025-01-15", 4, 1))
+        self.assertEqual(assignments, self.assignments_data)
+        self.assertIsNone(loader._assignments)
+
+    def test_parse_cache_ignored_after_source_change(self):
+        cache_dir = Path(self.test_dir) / "cache"
+        DataLoader(base_dir=Path(self.test_dir), cache_dir=cache_dir).get_positions()
+
+        self.positions_data.append({"id": 3, "name": "Tester"})
+        self._write_test_files()
+        positions = DataLoader(base_dir=Path(self.test_dir), cache_dir=cache_dir).get_positions()
+
+        self.assertEqual(positions, self.positions_data)
+
+    def test_dense_ids_use_list_lookup(self):
+        self.loader.get_positions()
+
+        self.assertIsInstance(self.loader._positions_by_id, list)
+        self.assertIsNone(self.loader.get_position_by_id(0))
+        self.assertIsNone(self.loader.get_position_by_id(-1))
+        self.assertIsNone(self.loader.get_position_by_id(None))
+
+    def test_sparse_ids_use_dict_lookup(self):
+        self.workers_data.append({"id": 10**9, "name": "Bob", "position_id": 1})
+        self._write_test_files()
+
+        self.assertEqual(self.loader.get_worker_by_id(10**9)["name"], "Bob")
+        self.assertIsInstance(self.loader._workers_by_id, dict)
+        self.assertIsNone(self.loader.get_worker_by_id(2))
+
+    def test_source_signature_tracks_file_changes(self):
+        signature = self.loader.get_source_signature()
+        self.assertEqual(signature, self.loader.get_source_signature())
+
+        self.positions_data.append({"id": 3, "name": "Tester"})
+        self._write_test_files()
+        self.assertNotEqual(signature, self.loader.get_source_signature())
+
+        (self.test_data_dir / "tasks.json").unlink()
+        self.assertIn(("tasks.json", None, None), self.loader.get_source_signature())
+
+    def test_invalid_json_raises_loader_error(self):
+        (self.test_data_dir / "positions.json").write_text("[{not json")
+
+        with self.assertRaises(DataLoaderError):
+            self.loader.get_positions()
+
+    def test_empty_file_raises_loader_error(self):
+        (self.test_data_dir / "tasks.json").write_bytes(b"")
+
+        with self.assertRaises(DataLoaderError):
+            self.loader.get_tasks()
+
+    def test_non_list_json_raises_loader_error(self):
+        (self.test_data_dir / "positions.json").write_text('{"id": 1}')
+
+        with self.assertRaises(DataLoaderError):
+            self.loader.get_positions()
+
+    def test_missing_file_raises_loader_error(self):
+        (self.test_data_dir / "workers.json").unlink()
+
+        with self.assertRaises(DataLoaderError):
+            self.loader.get_workers()
+
+    def test_refresh_changed_files_keeps_unchanged_file_caches(self):
+        self.loader.refresh_changed_files(self.loader.get_source_signature())
+        self.loader.get_positions()
+        task_fields_by_id = self.loader.get_task_fields_by_id()
+
+        self.positions_data.append({"id": 3, "name": "Tester"})
+        (self.test_data_dir / "positions.json").write_text(json.dumps(self.positions_data))
+        self.loader.refresh_changed_files(self.loader.get_source_signature())
+
+        self.assertIsNone(self.loader._positions)
+        self.assertIs(self.loader.get_task_fields_by_id(), task_fields_by_id)
+        self.assertEqual(len(self.loader.get_positions()), 3)
+
+    def test_refresh_changed_files_first_call_clears_everything(self):
+        self.loader.get_positions()
+
+        self.loader.refresh_changed_files(self.loader.get_source_signature())
+
+        self.assertIsNone(self.loader._positions)
+
+    def test_refresh_cache_reloads_changed_file(self):
+        self.loader.get_positions()
+        self.positions_data.append({"id": 3, "name": "Tester"})
+        self._write_test_files()
+
+        self.loader.refresh_cache()
+
+        self.assertEqual(len(self.loader.get_positions()), 3)
@@ -1,71 +1,90 @@
-import os
+import copy
+import shutil
 import tempfile
 import json
 from pathlib import Path
+from typing import List
 from django.test import TestCase
 from unittest.mock import patch
 
 from scheduler.loaders import DataLoader, DataLoaderError
-from scheduler.processors import ScheduleDataProcessor, ScheduleProcessorError
+from scheduler.processors import ScheduleDataProcessor, ScheduleProcessorError, aggregate_assignments
+from scheduler.constants import EMPTY_POSITION_ID
 
 
 class ScheduleDataProcessorTestCase(TestCase):
     """Test cases for ScheduleDataProcessor using Django's testing framework."""
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        # Create temporary directory for test data
-        self.test_dir = tempfile.mkdtemp()
-        self.test_data_dir = Path(self.test_dir) / "data"
-        self.test_data_dir.mkdir()
-
-        # Create simple test data
-        self.positions_data = [{"id": 1, "name": "Manager"}, {"id": 2, "name": "Developer"}]
-
-        self.workers_data = [
-            {"id": 1, "name": "Alice", "position_id": 1},
-            {"id": 2, "name": "Bob", "position_id": 2},
-            {"id": 3, "name": "Carol", "position_id": 2},
-        ]
-
-        self.tasks_data = [
-            {"id": 1, "position_id": 1, "duration": 4, "date": "2025-01-15"},
-            {"id": 2, "position_id": 2, "duration": 6, "date": "2025-01-15"},
-            {"id": 3, "position_id": 2, "duration": 3, "date": "2025-01-16"},
-        ]
-
-        self.assignments_data = [
-            {"task_id": 1, "worker_id": 1},
-            {"task_id": 2, "worker_id": 2},
-            {"task_id": 3, "worker_id": 3},
-        ]
-
-        # Write test data files
-        self._write_test_files()
+    POSITIONS_DATA = [{"id": 1, "name": "Manager"}, {"id": 2, "name": "Developer"}]
+
+    WORKERS_DATA = [
+        {"id": 1, "name": "Alice", "position_id": 1},
+        {"id": 2, "name": "Bob", "position_id": 2},
+        {"id": 3, "name": "Carol", "position_id": 2},
+    ]
+
+    TASKS_DATA = [
+        {"id": 1, "position_id": 1, "duration": 4, "date": "2025-01-15"},
+        {"id": 2, "position_id": 2, "duration": 6, "date": "2025-01-15"},
+        {"id": 3, "position_id": 2, "duration": 3, "date": "2025-01-16"},
+    ]
+
+    ASSIGNMENTS_DATA = [
+        {"task_id": 1, "worker_id": 1},
+        {"task_id": 2, "worker_id": 2},
+        {"task_id": 3, "worker_id": 3},
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        """Write the shared test data once and create one DataLoader and processor over it."""
+        super().setUpClass()
+        cls.test_dir = cls._write_test_files(cls.POSITIONS_DATA, cls.WORKERS_DATA, cls.TASKS_DATA, cls.ASSIGNMENTS_DATA)
+
+        # Shared by the tests that only read the data, so the files are parsed once per class
+        cls.loader = DataLoader(base_dir=Path(cls.test_dir))
+        cls.processor = ScheduleDataProcessor(cls.loader)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared test data."""
+        shutil.rmtree(cls.test_dir)
+        super().tearDownClass()
 
-        # Create DataLoader and processor
-        self.loader = DataLoader(base_dir=Path(self.test_dir))
-        self.processor = ScheduleDataProcessor(self.loader)
-
-    def tearDown(self):
-        """Clean up after each test method."""
-        import shutil
-
-        shutil.rmtree(self.test_dir)
+    def setUp(self):
+        """Give each test its own copy of the test data to modify."""
+        self.positions_data = copy.deepcopy(self.POSITIONS_DATA)
+        self.workers_data = copy.deepcopy(self.WORKERS_DATA)
+        self.tasks_data = copy.deepcopy(self.TASKS_DATA)
+        self.assignments_data = copy.deepcopy(self.ASSIGNMENTS_DATA)
+
+    @staticmethod
+    def _write_test_files(positions: List, workers: List, tasks: List, assignments: List) -> str:
+        """Write test data to JSON files in a new temporary directory and return that directory."""
+        test_dir = tempfile.mkdtemp()
+        test_data_dir = Path(test_dir) / "data"
+        test_data_dir.mkdir()
 
-    def _write_test_files(self):
-        """Write test data to JSON files."""
         files_data = {
-            "positions.json": self.positions_data,
-            "workers.json": self.workers_data,
-            "tasks.json": self.tasks_data,
-            "assignments.json": self.assignments_data,
+            "positions.json": positions,
+            "workers.json": workers,
+            "tasks.json": tasks,
+            "assignments.json": assignments,
         }
 
         for filename, data in files_data.items():
-            file_path = self.test_data_dir / filename
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=2)
+            (test_data_dir / filename).write_text(json.dumps(data))
+
+        return test_dir
+
+    def _create_processor(self) -> ScheduleDataProcessor:
+        """Write this test's copy of the test data to its own directory and create a processor over it."""
+        test_dir = self._write_test_files(
+            self.positions_data, self.workers_data, self.tasks_data, self.assignments_data
+        )
+        self.addCleanup(shutil.rmtree, test_dir)
+
+        return ScheduleDataProcessor(DataLoader(base_dir=Path(test_dir)))
 
     def test_process_schedule_data__basic_structure(self):
         result = self.processor.process_schedule_data()
@@ -149,11 +168,9 @@ class ScheduleDataProcessorTestCase(TestCase):
 
         self.tasks_data.append(additional_task)
         self.assignments_data.append(additional_assignment)
-        self._write_test_files()
 
         # Create new loader/processor to pick up updated data
-        loader = DataLoader(base_dir=Path(self.test_dir))
-        processor = ScheduleDataProcessor(loader)
+        processor = self._create_processor()
 
         result = processor.process_schedule_data()
         rows = result["rows"]
@@ -168,10 +185,7 @@ class ScheduleDataProcessorTestCase(TestCase):
 
     def test_process_schedule_data__empty_assignments(self):
         self.assignments_data = []
-        self._write_test_files()
-
-        loader = DataLoader(base_dir=Path(self.test_dir))
-        processor = ScheduleDataProcessor(loader)
+        processor = self._create_processor()
 
         result = processor.process_schedule_data()
 
@@ -198,10 +212,36 @@ class ScheduleDataProcessorTestCase(TestCase):
     def test_process_schedule_data__with_invalid_date(self):
         # Add task with invalid date
         self.tasks_data[0]["date"] = "invalid-date"
-        self._write_test_files()
+        processor = self._create_processor()
+
+        with self.assertRaises(ScheduleProcessorError):
+            processor.process_schedule_data()
+
+    def test_aggregate_assignments(self):
+        task_fields_by_id = {1: ("2025-01-15", 4, 1), 2: ("2025-01-15", 2, 1), 3: ("2025-01-16", 5, None)}
+        assignments = [{"task_id": 1, "worker_id": 1}, {"task_id": 2, "worker_id": 1}, {"task_id": 3, "worker_id": 2}]
+
+        worker_date, position_worker, position_date = aggregate_assignments(assignments, task_fields_by_id)
+
+        self.assertEqual(worker_date[1], {"2025-01-15": 6})
+        self.assertEqual(worker_date[2], {"2025-01-16": 5})
+        self.assertEqual(position_worker, {1: {1}, EMPTY_POSITION_ID: {2}})
+        self.assertEqual(position_date[EMPTY_POSITION_ID], {"2025-01-16": 5})
 
-        loader = DataLoader(base_dir=Path(self.test_dir))
-        processor = ScheduleDataProcessor(loader)
+    def test_aggregate_assignments_unknown_task_raises_error(self):
+        # Dense ids give a list lookup, where -1 would otherwise read the last task
+        task_fields_by_id = [("2025-01-15", 4, 1), None, ("2025-01-16", 5, 5)]
+
+        for task_id in (-1, 1, 3):
+            with self.subTest(task_id=task_id), self.assertRaises(ScheduleProcessorError):
+                aggregate_assignments([{"task_id": task_id, "worker_id": 1}], task_fields_by_id)
+
+        with self.assertRaises(ScheduleProcessorError):
+            aggregate_assignments([{"task_id": 99, "worker_id": 1}], {1: ("2025-01-15", 4, 1)})
+
+    def test_process_schedule_data__negative_task_id_raises_error(self):
+        self.assignments_data.append({"task_id": -1, "worker_id": 1})
+        processor = self._create_processor()
 
         with self.assertRaises(ScheduleProcessorError):
             processor.process_schedule_data()
@@ -215,6 +255,17 @@ class ScheduleDataProcessorTestCase(TestCase):
         with self.assertRaises(ScheduleProcessorError):
             self.processor._format_date("invalid-date")
 
+    def test_date_format_memoized_on_loader(self):
+        processor = self._create_processor()
+
+        processor._format_date("2025-01-15")
+        self.assertEqual(processor.data_loader.get_formatted_dates_cache(), {"2025-01-15": "15 Jan 25"})
+
+        processor.data_loader.refresh_cache()
+        with patch("scheduler.processors.date_format") as mock_date_format:
+            self.assertEqual(processor._format_date("2025-01-15"), "15 Jan 25")
+        mock_date_format.assert_not_called()
+
     def test_null_position_id_handling(self):
         """Test that null position_id values are handled correctly."""
         # Add task with null position_id
@@ -230,11 +281,9 @@ class ScheduleDataProcessorTestCase(TestCase):
         self.tasks_data.append(null_position_task)
         self.workers_data.append(null_position_worker)
         self.assignments_data.append(null_assignment)
-        self._write_test_files()
 
         # Process schedule data
-        loader = DataLoader(base_dir=Path(self.test_dir))
-        processor = ScheduleDataProcessor(loader)
+        processor = self._create_processor()
         result = processor.process_schedule_data()
 
         # Verify empty position is included
@@ -0,0 +1,42 @@
+import json
+from datetime import datetime, time, timezone
+from decimal import Decimal
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from unittest.mock import patch
+
+from scheduler.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTestCase(TestCase):
+    """Test cases for the orjson-backed renderer."""
+
+    def setUp(self):
+        self.renderer = ORJSONRenderer()
+        self.data = {"columns": ["Name", "15 Jan 25"], "rows": [["Zoë", 4]]}
+
+    def test_render_returns_json_bytes(self):
+        rendered = self.renderer.render(self.data)
+
+        self.assertIsInstance(rendered, bytes)
+        self.assertEqual(json.loads(rendered), self.data)
+
+    def test_render_none_returns_empty_body(self):
+        self.assertEqual(self.renderer.render(None), b"")
+
+    def test_render_uses_drf_encoder_for_unknown_types(self):
+        self.assertEqual(json.loads(self.renderer.render({"hours": Decimal("1.5")})), {"hours": 1.5})
+
+    def test_render_datetimes_like_drf(self):
+        data = {"at": datetime(2025, 1, 15, 9, 30, 0, 123456, tzinfo=timezone.utc), "time": time(9, 30, 0, 123456)}
+
+        self.assertEqual(self.renderer.render(data), JSONRenderer().render(data))
+
+    def test_render_coerces_non_string_keys(self):
+        self.assertEqual(json.loads(self.renderer.render({1: "Manager"})), {"1": "Manager"})
+
+    def test_render_falls_back_without_orjson(self):
+        with patch("scheduler.renderers.orjson", None):
+            rendered = self.renderer.render(self.data)
+
+        self.assertEqual(json.loads(rendered), self.data)
@@ -1,8 +1,24 @@
-from django.test import TestCase
+import json
+import shutil
+import tempfile
+import threading
+import time
+from django.conf import settings
+from django.test import TestCase, override_settings
 from unittest.mock import patch, Mock, MagicMock
 from pathlib import Path
-
-from scheduler.services import get_schedule_data, _get_data_loader, _get_processor
+from concurrent.futures import ThreadPoolExecutor
+
+from scheduler.services import (
+    get_schedule_data,
+    get_serialized_schedule_data,
+    preload_schedule_data,
+    start_background_refresh,
+    stop_background_refresh,
+    warm_up_schedule,
+    _get_data_loader,
+    _get_processor,
+)
 from scheduler.loaders import DataLoader
 from scheduler.processors import ScheduleDataProcessor, ScheduleProcessorError
 import scheduler.services as services_module
@@ -16,12 +32,16 @@ class ScheduleServicesTestCase(TestCase):
         # Reset global instances before each test
         services_module._data_loader = None
         services_module._processor = None
+        services_module._cached_result = None
+        services_module._cached_serialized = None
 
     def tearDown(self):
         """Clean up after each test."""
         # Reset global instances after each test
         services_module._data_loader = None
         services_module._processor = None
+        services_module._cached_result = None
+        services_module._cached_serialized = None
 
     def test_get_data_loader_creates_instance(self):
         """Test that _get_data_loader creates a new instance when none exists."""
@@ -64,6 +84,162 @@ class ScheduleServicesTestCase(TestCase):
             mock_get_loader.assert_called_once()
             self.assertIsInstance(processor, ScheduleDataProcessor)
 
+    def test_preload_schedule_data_caches_result(self):
+        """Test that preloading builds and caches the schedule."""
+        preload_schedule_data()
+
+        self.assertIsNotNone(services_module._cached_result)
+        self.assertIsNotNone(services_module._cached_serialized)
+
+    def test_preload_schedule_data_logs_loader_error(self):
+        """Test that a preload failure is logged instead of raised."""
+        services_module._data_loader = DataLoader(base_dir=Path("/nonexistent"))
+
+        with self.assertLogs("scheduler.services", level="WARNING"):
+            preload_schedule_data()
+
+    @override_settings(SCHEDULER_REFRESH_INTERVAL=30)
+    def test_warm_up_schedule_preloads_and_starts_refresh(self):
+        """Test that warming up builds the schedule and starts the configured refresh."""
+        with patch("scheduler.services.start_background_refresh") as mock_start:
+            warm_up_schedule()
+
+        self.assertIsNotNone(services_module._cached_serialized)
+        mock_start.assert_called_once_with(30)
+
+    def test_warm_up_schedule_without_refresh_interval(self):
+        """Test that no refresh thread is started when the interval is 0."""
+        with patch("scheduler.services.start_background_refresh") as mock_start:
+            warm_up_schedule()
+
+        mock_start.assert_not_called()
+
+    def test_background_refresh_rebuilds_cache(self):
+        """Test that the refresh thread keeps the cache populated until stopped."""
+        self.addCleanup(stop_background_refresh)
+        refreshed = threading.Event()
+
+        with patch("scheduler.services._refresh_schedule_data", side_effect=refreshed.set):
+            start_background_refresh(0.01)
+            self.assertTrue(refreshed.wait(5))
+            stop_background_refresh()
+
+        self.assertIsNone(services_module._refresh_thread)
+
+    def test_background_refresh_survives_unexpected_error(self):
+        """Test that an unexpected refresh failure is logged and the thread keeps refreshing."""
+        self.addCleanup(stop_background_refresh)
+        refreshed = threading.Event()
+        calls = []
+
+        def refresh():
+            calls.append(None)
+            if len(calls) == 1:
+                raise OSError("Cache directory is read-only")
+            refreshed.set()
+
+        with patch("scheduler.services._refresh_schedule_data", side_effect=refresh):
+            with self.assertLogs("scheduler.services", level="ERROR"):
+                start_background_refresh(0.01)
+                self.assertTrue(refreshed.wait(5))
+                stop_background_refresh()
+
+    def test_background_refresh_keeps_requests_on_cached_data(self):
+        """Test that while the refresh thread runs, requests get the last good schedule without rebuilding."""
+        test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, test_dir)
+        shutil.copytree(Path(settings.BASE_DIR) / "data", Path(test_dir) / "data")
+        services_module._data_loader = DataLoader(base_dir=Path(test_dir))
+        first = get_schedule_data()
+
+        services_module._refresh_thread = Mock(is_alive=Mock(return_value=True))
+        self.addCleanup(setattr, services_module, "_refresh_thread", None)
+        (Path(test_dir) / "data" / "positions.json").write_text("[{not json")
+
+        self.assertIs(get_schedule_data(), first)
+        with self.assertLogs("scheduler.services", level="WARNING"):
+            services_module._refresh_schedule_data()
+        self.assertIs(get_schedule_data(), first)
+
+    def test_get_schedule_data_reuses_cached_result(self):
+        """Test that unchanged data files are not processed again."""
+        processor = _get_processor()
+
+        with patch.object(processor, "process_schedule_data", wraps=processor.process_schedule_data) as mock_process:
+            first = get_schedule_data()
+            second = get_schedule_data()
+
+        mock_process.assert_called_once()
+        self.assertIs(first, second)
+
+    def test_get_schedule_data_concurrent_calls_process_once(self):
+        """Test that concurrent calls on a cold cache share one rebuild."""
+        processor = _get_processor()
+        barrier = threading.Barrier(4)
+
+        def get_after_barrier():
+            barrier.wait()
+            return get_schedule_data()
+
+        with patch.object(processor, "process_schedule_data", wraps=processor.process_schedule_data) as mock_process:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(lambda _: get_after_barrier(), range(4)))
+
+        mock_process.assert_called_once()
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_get_schedule_data_concurrent_calls_share_failure(self):
+        """Test that a failed rebuild is raised to every concurrent caller instead of being retried by each."""
+        processor = _get_processor()
+        barrier = threading.Barrier(4)
+
+        def fail_after_others_wait():
+            time.sleep(0.2)  # Let the other callers queue up on this rebuild
+            raise ScheduleProcessorError("Bad data")
+
+        def get_after_barrier():
+            barrier.wait()
+            try:
+                get_schedule_data()
+            except ScheduleProcessorError as e:
+                return e
+
+        with patch.object(processor, "process_schedule_data", side_effect=fail_after_others_wait) as mock_process:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                errors = list(executor.map(lambda _: get_after_barrier(), range(4)))
+
+        mock_process.assert_called_once()
+        self.assertTrue(all(isinstance(error, ScheduleProcessorError) for error in errors))
+        self.assertIsNone(services_module._rebuild)
+
+    def test_get_schedule_data_rebuilds_after_file_change(self):
+        """Test that rewriting a data file invalidates the cached result."""
+        test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, test_dir)
+        shutil.copytree(Path(settings.BASE_DIR) / "data", Path(test_dir) / "data")
+        services_module._data_loader = DataLoader(base_dir=Path(test_dir))
+
+        first = get_schedule_data()
+
+        positions_path = Path(test_dir) / "data" / "positions.json"
+        positions = json.loads(positions_path.read_text())
+        positions[0]["name"] = "Renamed Position"
+        positions_path.write_text(json.dumps(positions))
+
+        second = get_schedule_data()
+
+        self.assertIsNot(first, second)
+        self.assertIn("Renamed Position", [row[0] for row in second["rows"]])
+
+    def test_get_serialized_schedule_data_encodes_once(self):
+        """Test that the JSON body is reused while the data is unchanged."""
+        first = get_serialized_schedule_data()
+        second = get_serialized_schedule_data()
+
+        self.assertIs(first.body, second.body)
+        self.assertIs(first.data, get_schedule_data())
+        self.assertEqual(json.loads(first.body), first.data)
+
     def test_services_integration(self):
         """Test full integration of services layer."""
         # This should work end-to-end with real data
@@ -1,57 +1,121 @@
 import logging
-from rest_framework.decorators import api_view
-from rest_framework.response import Response
-from rest_framework import status
+from http import HTTPStatus
+from django.http import HttpResponse
+from django.middleware.gzip import re_accepts_gzip
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.views.decorators.http import require_safe
 
-from .services import get_schedule_data
+from .services import SerializedSchedule, get_serialized_schedule_data
 from .loaders import DataLoaderError
 from .processors import ScheduleProcessorError
+from .renderers import ORJSONRenderer
 
 logger = logging.getLogger(__name__)
 
+_renderer = ORJSONRenderer()
 
-@api_view(["GET"])
-def schedule_table(request) -> Response:
+_OK = HTTPStatus.OK
+_ERR = HTTPStatus.INTERNAL_SERVER_ERROR
+_CONTENT_TYPE = ORJSONRenderer.media_type
+# Clients may keep a copy but must revalidate it (cheaply, via the ETag) before every reuse
+_CACHE_CONTROL = "private, max-age=0, must-revalidate"
+
+
+def _encode_error_prefix(message: str, code: str) -> bytes:
+    """Encode an error body without its closing brace, so a detail field can be appended."""
+    return _renderer.render({"error": message, "code": code})[:-1]
+
+
+# Log message and pre-encoded body prefix of the expected failures; anything else is an internal error
+_ERROR_RESPONSES = {
+    DataLoaderError: (
+        "Data loading error",
+        _encode_error_prefix("Failed to load data from JSON files", "DATA_LOAD_ERROR"),
+    ),
+    ScheduleProcessorError: (
+        "Data processing error",
+        _encode_error_prefix("Failed to process schedule data", "PROCESSING_ERROR"),
+    ),
+}
+_INTERNAL_ERROR_BODY = _renderer.render(
+    {"error": "Internal server error", "detail": "An unexpected error occurred", "code": "INTERNAL_ERROR"}
+)
+
+
+def _schedule_response(request, schedule: SerializedSchedule) -> HttpResponse:
+    """
+    Build the schedule response from its cached encodings.
+
+    The body is already encoded (and compressed), so it bypasses the renderer.
+    Clients that already have this version get a 304 Not Modified without a body.
+    """
+    gzipped = schedule.gzipped_body is not None and re_accepts_gzip.search(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+    body = schedule.gzipped_body if gzipped else schedule.body
+
+    if request.method == "HEAD":
+        # Same headers as a GET, but without the body. The ETag and length come from the encoded body,
+        # so a HEAD is only a cache lookup while the schedule is current: on a cold cache or after a data
+        # file changes it rebuilds the schedule just like a GET would (and the next GET reuses the result)
+        response = HttpResponse(status=_OK, content_type=_CONTENT_TYPE)
+        response["Content-Length"] = str(len(body))
+    else:
+        response = HttpResponse(body, status=_OK, content_type=_CONTENT_TYPE)
+    if gzipped:
+        response["Content-Encoding"] = "gzip"
+    if schedule.gzipped_body is not None:
+        patch_vary_headers(response, ("Accept-Encoding",))
+    response["ETag"] = schedule.etag
+    response["Cache-Control"] = _CACHE_CONTROL
+
+    return get_conditional_response(request, etag=schedule.etag, response=response)
+
+
+def _error_response(error: Exception) -> HttpResponse:
+    """
+    Log an error raised while serving the schedule and build its 500 response.
+
+    Only the detail is encoded per error; the rest of each body is encoded once at import.
+    """
+    # Exact class lookup first; subclasses of the expected errors keep their parent's response
+    expected = _ERROR_RESPONSES.get(error.__class__)
+    if expected is None:
+        for error_class, error_response in _ERROR_RESPONSES.items():
+            if isinstance(error, error_class):
+                expected = error_response
+                break
+    if expected is not None:
+        log_message, body_prefix = expected
+        logger.error("%s: %s", log_message, error)
+        body = body_prefix + b',"detail":' + _renderer.render(str(error)) + b"}"
+    else:
+        logger.exception("Unexpected error in schedule_table: %s", error)
+        body = _INTERNAL_ERROR_BODY
+
+    return HttpResponse(body, status=_ERR, content_type=_CONTENT_TYPE)
+
+
+@require_safe
+def schedule_table(request) -> HttpResponse:
     """
     Return formatted schedule data for frontend table consumption.
+
+    A plain Django view: every response body is pre-encoded JSON, so DRF's negotiation,
+    rendering, authentication and throttling layers would have nothing to do.
+    The view is sync because the project is served over WSGI, where an async view would only
+    add an event loop and a thread hop to every request.
     """
+    # Checked per request rather than at import, so log levels can still change at runtime
+    info_enabled = logger.isEnabledFor(logging.INFO)
     try:
-        logger.info("Processing schedule table request")
-
-        data = get_schedule_data()
-
-        logger.info(f"Successfully returned schedule data with {len(data.get('rows', []))} rows")
-        return Response(data, status=status.HTTP_200_OK)
-
-    except DataLoaderError as e:
-        logger.error(f"Data loading error: {e}")
-        return Response(
-            {
-                "error": "Failed to load data from JSON files",
-                "detail": str(e),
-                "code": "DATA_LOAD_ERROR",
-            },
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
-
-    except ScheduleProcessorError as e:
-        logger.error(f"Data processing error: {e}")
-        return Response(
-            {
-                "error": "Failed to process schedule data",
-                "detail": str(e),
-                "code": "PROCESSING_ERROR",
-            },
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
+        if info_enabled:
+            logger.info("Processing schedule table request")
+
+        schedule = get_serialized_schedule_data()
+        data = schedule.data
+
+        if info_enabled:
+            logger.info("Successfully returned schedule data with %d rows", len(data.get("rows", ())))
+        return _schedule_response(request, schedule)
 
     except Exception as e:
-        logger.exception(f"Unexpected error in schedule_table: {e}")
-        return Response(
-            {
-                "error": "Internal server error",
-                "detail": "An unexpected error occurred",
-                "code": "INTERNAL_ERROR",
-            },
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
+        return _error_response(e)